@@ -4,16 +4,21 @@ Script to create placeholder ground tile sprites for Adventure Jumper.
 """
 
 from PIL import Image, ImageDraw, ImageFilter
-import os
+from functools import lru_cache
+from pathlib import Path
 import random
 import math
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Border drawn around every tile to make tiling more obvious
+BORDER_COLOR = (0, 0, 0, 80)
+
 def create_ground_tiles():
     """Create placeholder ground tile sprites for different terrain types."""
     # Create output directory if it doesn't exist
-    output_dir = r'c:\Users\User\source\repos\Cascade\adventure-jumper\assets\images\tilesets'
-    base_dir = output_dir
-    os.makedirs(output_dir, exist_ok=True)
+    output_dir = REPO_ROOT / 'assets' / 'images' / 'tilesets'
+    output_dir.mkdir(parents=True, exist_ok=True)
     
     # Create different tile types
     tiles_to_create = [
@@ -29,12 +34,9 @@ def create_ground_tiles():
         ('crystal_tile.png', (147, 112, 219), 'crystal') # Medium Purple
     ]
     
-    # Create tileset folder if it doesn't exist
-    os.makedirs(os.path.join(base_dir), exist_ok=True)
-    
     # Create each tile
     for filename, base_color, tile_type in tiles_to_create:
-        create_tile(os.path.join(base_dir, filename), base_color, tile_type)
+        create_tile(output_dir / filename, base_color, tile_type)
         print(f"Created {filename}")
     
     print("All ground tiles created successfully!")
@@ -43,13 +45,10 @@ def create_tile(output_path, base_color, tile_type, size=(16, 16)):
     """Create a ground tile with the specified parameters."""
     width, height = size
     
-    # Create base image with the base color
-    image = Image.new('RGBA', size, (0, 0, 0, 0))
+    # Create base image already filled with the base color
+    image = Image.new('RGBA', size, base_color)
     draw = ImageDraw.Draw(image)
     
-    # Fill background
-    draw.rectangle([0, 0, width-1, height-1], fill=base_color)
-    
     # Add texture based on tile type
     if tile_type == 'dirt':
         add_dirt_texture(draw, width, height, base_color)
@@ -67,13 +66,25 @@ def create_tile(output_path, base_color, tile_type, size=(16, 16)):
         add_crystal_texture(draw, width, height, base_color)
     
     # Add a subtle border to make tiling more obvious
-    draw.rectangle([0, 0, width-1, height-1], outline=(0, 0, 0, 80), width=1)
+    draw_border(image)
     
     # Save the tile
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
     image.save(output_path)
     return output_path
 
+@lru_cache(maxsize=None)
+def _border_mask(size):
+    """Build (once per tile size) a mask covering the outer pixel ring of a tile."""
+    width, height = size
+    mask = Image.new('L', size, 0)
+    ImageDraw.Draw(mask).rectangle([0, 0, width-1, height-1], outline=255, width=1)
+    return mask
+
+def draw_border(image, color=BORDER_COLOR):
+    """Stamp the shared border mask onto a tile in a single paste."""
+    image.paste(color, (0, 0), _border_mask(image.size))
+
 def add_dirt_texture(draw, width, height, base_color):
     """Add a dirt-like texture with small dots and variations."""
     # Add small dots for texture
@@ -3,11 +3,13 @@
 Script to create a placeholder sprite for Kael, the main character in Adventure Jumper.
 """
 
-from PIL import Image, ImageDraw, ImageFont
-import os
+from PIL import Image, ImageDraw
+from pathlib import Path
 import random
 import math
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
 def create_kael_sprite(output_size=(32, 64), output_filename="player_idle.png"):
     """
     Creates a placeholder sprite for Kael with the correct dimensions.
@@ -20,8 +22,8 @@ def create_kael_sprite(output_size=(32, 64), output_filename="player_idle.png"):
         Path to the created sprite
     """
     # Create output directory if it doesn't exist
-    output_dir = r'c:\Users\User\source\repos\Cascade\adventure-jumper\assets\images\characters\player'
-    os.makedirs(output_dir, exist_ok=True)
+    output_dir = REPO_ROOT / 'assets' / 'images' / 'characters' / 'player'
+    output_dir.mkdir(parents=True, exist_ok=True)
     
     # Define color scheme for Kael (blue/teal with Aether energy accents)
     # Based on the game's lore, Kael is a Jumper who can harness Aether energy
@@ -180,7 +182,7 @@ def create_kael_sprite(output_size=(32, 64), output_filename="player_idle.png"):
     final_image = Image.alpha_composite(result, particles)
     
     # Save the sprite
-    output_path = os.path.join(output_dir, output_filename)
+    output_path = output_dir / output_filename
     final_image.save(output_path)
     print(f"Created Kael sprite at: {output_path}")
     return output_path
@@ -7,20 +7,29 @@ This generates sprite sheets for all required Mira animation frames:
 - Pointing animation (3 frames)
 """
 
-from PIL import Image, ImageDraw, ImageFont
-import os
-import random
+from PIL import Image, ImageDraw, ImageFilter, PngImagePlugin
+from concurrent.futures import ProcessPoolExecutor
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+import hashlib
 import math
-import colorsys
-import sys
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+OUTPUT_DIR = REPO_ROOT / 'assets' / 'images' / 'characters' / 'npcs'
+
+# Bump whenever the drawing code changes so existing sheets are regenerated
+SPRITE_VERSION = 3
 
 def create_mira_sprites():
     """
     Creates all Mira NPC sprites with appropriate styling.
+    
+    Returns:
+        List of paths to the created sprite sheets
     """
     # Create output directory if it doesn't exist
-    output_dir = r'c:\Users\User\source\repos\Cascade\adventure-jumper\assets\images\characters\npcs'
-    os.makedirs(output_dir, exist_ok=True)
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
     # Define color scheme for Mira based on character specs
     # Mira is the Archivist with silver hair, blue robes, and golden accessories
@@ -36,12 +45,21 @@ def create_mira_sprites():
         ('character_mira_point.png', 3, 'pointing') # 3 frames, 96x32 total
     ]
     
-    # Create each sprite sheet
-    for filename, frames, pose in sprites_to_create:
-        create_mira_sprite_sheet(filename, frames, primary_color, secondary_color, accent_color, pose)
-        print(f"Created {filename}")
+    # Create each sprite sheet - sheets share no state, so build them in parallel
+    jobs = [(filename, frames, primary_color, secondary_color, accent_color, pose)
+            for filename, frames, pose in sprites_to_create]
+    with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+        results = list(executor.map(_create_sheet_job, jobs))
+    for output_path, built in results:
+        status = "Created" if built else "Up to date:"
+        print(f"{status} {output_path.name}")
     
     print("All Mira sprites created successfully!")
+    return [output_path for output_path, _ in results]
+
+def _create_sheet_job(job):
+    """Process pool entry point: unpack a job tuple and build that sprite sheet"""
+    return create_mira_sprite_sheet(*job)
 
 def create_mira_sprite_sheet(filename, frame_count, primary_color, secondary_color, accent_color, pose):
     """
@@ -54,51 +72,125 @@ def create_mira_sprite_sheet(filename, frame_count, primary_color, secondary_col
         secondary_color: Hair color (silver)
         accent_color: Accessories color (gold)
         pose: Animation type ('idle', 'talking', 'pointing')
+    
+    Returns:
+        (output_path, built) - built is False when an up-to-date sheet was kept
     """
-    output_dir = r'c:\Users\User\source\repos\Cascade\adventure-jumper\assets\images\characters\npcs'
+    output_path = OUTPUT_DIR / filename
+    
+    # Skip the work entirely if the existing sheet was built from the same inputs
+    build_key = hashlib.sha1(repr((filename, frame_count, primary_color, secondary_color,
+                                   accent_color, pose, SPRITE_VERSION)).encode()).hexdigest()
+    if sheet_is_up_to_date(output_path, build_key):
+        return output_path, False
     
     # Each frame is 32x32 pixels
     frame_size = 32
     sprite_width = frame_count * frame_size
     sprite_height = frame_size
     
-    # Create base transparent sprite sheet
+    # Create base transparent sprite sheet and draw every frame straight onto it
     sprite_sheet = Image.new('RGBA', (sprite_width, sprite_height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(sprite_sheet)
+    
+    # Proportions don't change between frames, so look them up once per sheet
+    layout = mira_layout(frame_size, frame_size)
+    
+    # Talking and pointing frames share a static body, so render it once and
+    # paste it into each frame before drawing the animated parts on top
+    base = None if pose == 'idle' else render_mira_base(layout, primary_color,
+                                                        secondary_color, accent_color)
+    
+    # Sine terms only depend on the frame, so compute them once for the whole sheet
+    waves = animation_waves(frame_count)
     
     # Generate each frame
     for frame in range(frame_count):
-        # Create a single frame
-        frame_img = Image.new('RGBA', (frame_size, frame_size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(frame_img)
-        
         # Calculate animation offset based on frame number
         animation_progress = frame / max(frame_count - 1, 1)  # 0.0 to 1.0
         
-        # Draw Mira based on the pose and animation progress
-        draw_mira_frame(draw, frame_size, frame_size, primary_color, secondary_color, 
-                      accent_color, pose, animation_progress, frame)
+        # Draw Mira based on the pose and animation progress, shifted into this frame's slot
+        x_offset = frame * frame_size
+        
+        # Start each frame from a clean slot: a straight, unblended copy of the cached
+        # body when there is one, otherwise transparency. Either way this also wipes
+        # anything the previous frame spilled past its edge (e.g. the pointing hand)
+        if base is not None:
+            sprite_sheet.paste(base, (x_offset, 0))
+        else:
+            sprite_sheet.paste((0, 0, 0, 0), (x_offset, 0, x_offset + frame_size, frame_size))
         
-        # Add the frame to the sprite sheet
-        sprite_sheet.paste(frame_img, (frame * frame_size, 0))
+        draw_mira_frame(sprite_sheet, draw, layout, primary_color, secondary_color, 
+                      accent_color, pose, animation_progress, frame, waves[frame], x_offset=x_offset)
     
-    # Save the sprite sheet
-    output_path = os.path.join(output_dir, filename)
-    sprite_sheet.save(output_path)
-    return output_path
+    # Save the sprite sheet, recording the build key in a PNG text chunk. Pillow writes
+    # that chunk before the pixel data, so save to a temporary file and swap it into
+    # place: an interrupted save must never leave a partial sheet carrying a valid key
+    pnginfo = PngImagePlugin.PngInfo()
+    pnginfo.add_text('build_key', build_key)
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    try:
+        sprite_sheet.save(tmp_path, format='PNG', compress_level=1, optimize=False, pnginfo=pnginfo)
+        tmp_path.replace(output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return output_path, True
 
-def draw_mira_frame(draw, width, height, primary_color, secondary_color, accent_color, pose, animation_progress, frame_num):
+def sheet_is_up_to_date(output_path, build_key):
     """
-    Draw a single frame of Mira's animation
+    Check whether the sheet at output_path was generated from the inputs hashed into build_key
     
-    Args:
-        draw: ImageDraw object
-        width, height: Frame dimensions
-        primary_color: Blue robe color
-        secondary_color: Silver hair color
-        accent_color: Gold accessory color
-        pose: Animation type ('idle', 'talking', 'pointing')
-        animation_progress: Progress through animation cycle (0.0 to 1.0)
-        frame_num: Current frame number
+    The key lives in the PNG itself rather than a sidecar file so nothing extra
+    ends up in the asset folders Flutter bundles. It is read before the pixel
+    data, so the image is decoded too: a truncated sheet counts as out of date.
+    """
+    if not output_path.exists():
+        return False
+    try:
+        with Image.open(output_path) as existing:
+            existing.load()
+            return existing.info.get('build_key') == build_key
+    except OSError:
+        return False
+
+def animation_waves(frame_count):
+    """
+    Precompute the sine terms Mira's animations use for every frame of a sheet
+    
+    Returns:
+        One (half_wave, wave, fast_wave) tuple per frame, holding sin(pi*t),
+        sin(2*pi*t) and sin(4*pi*t) for that frame's animation progress t
+    """
+    waves = []
+    for frame in range(frame_count):
+        animation_progress = frame / max(frame_count - 1, 1)
+        waves.append((
+            math.sin(animation_progress * 0.5 * math.pi * 2),
+            math.sin(animation_progress * math.pi * 2),
+            math.sin(animation_progress * math.pi * 4),
+        ))
+    return waves
+
+MiraLayout = namedtuple('MiraLayout', [
+    'width', 'height',
+    'head_width', 'head_height', 'head_x', 'head_y',
+    'body_width', 'body_height', 'body_x', 'body_y',
+    'robe_top_width', 'robe_bottom_width',
+    'face_width', 'face_height', 'face_x', 'face_y',
+    'glasses_size', 'left_eye_x', 'right_eye_x', 'eyes_y',
+    'bun_size', 'bun_x', 'bun_y',
+    'quill_x', 'quill_y', 'quill_length', 'quill_width',
+])
+
+@lru_cache(maxsize=4)
+def mira_layout(width, height):
+    """
+    Compute Mira's proportions for a frame of the given size
+    
+    None of these depend on the pose or animation progress, so they are
+    computed once per frame size instead of once per frame. X positions are
+    relative to the frame; callers add the frame's x offset.
     """
     # Base character proportions - Mira is drawn in 32x32 pixels
     head_width = width * 0.4
@@ -111,230 +203,292 @@ def draw_mira_frame(draw, width, height, primary_color, secondary_color, accent_
     body_x = (width - body_width) / 2
     body_y = head_y + head_height - 2  # Slight overlap with head
     
-    # Basic idle pose as foundation
+    # Flowing robe (wider at bottom)
+    robe_top_width = body_width
+    robe_bottom_width = body_width * 1.3
+    
+    # Face (slightly smaller ellipse)
+    face_width = head_width * 0.8
+    face_height = head_height * 0.8
+    face_x = head_x + (head_width - face_width) / 2
+    face_y = head_y + (head_height - face_height) / 2
+    
+    # Round glasses
+    glasses_size = head_width * 0.25
+    left_eye_x = head_x + head_width * 0.25 - glasses_size/2
+    right_eye_x = head_x + head_width * 0.75 - glasses_size/2
+    eyes_y = head_y + head_height * 0.4 - glasses_size/2
+    
+    # Hair bun on top of head
+    bun_size = head_width * 0.35
+    bun_x = head_x + (head_width - bun_size) / 2
+    bun_y = head_y - bun_size * 0.7
+    
+    # Floating quill
+    quill_x = width * 0.7
+    quill_y = height * 0.3
+    quill_length = width * 0.25
+    quill_width = height * 0.06
+    
+    return MiraLayout(
+        width, height,
+        head_width, head_height, head_x, head_y,
+        body_width, body_height, body_x, body_y,
+        robe_top_width, robe_bottom_width,
+        face_width, face_height, face_x, face_y,
+        glasses_size, left_eye_x, right_eye_x, eyes_y,
+        bun_size, bun_x, bun_y,
+        quill_x, quill_y, quill_length, quill_width,
+    )
+
+MiraBaseShapes = namedtuple('MiraBaseShapes', ['robe', 'head', 'face', 'left_glass', 'right_glass', 'bridge', 'bun'])
+
+@lru_cache(maxsize=16)
+def mira_base_shapes(layout, bob_offset=0):
+    """
+    Snap the coordinates of Mira's shared body to whole pixels once
+    
+    Pillow truncates float coordinates inside every draw call; doing the same
+    truncation here lets each frame hand it plain int tuples, shifted by the
+    frame's x offset, instead of re-deriving and converting floats per call.
+    
+    Args:
+        layout: Frame proportions from mira_layout()
+        bob_offset: Vertical bobbing of the robe hem (the head moves half as much)
+    
+    Returns:
+        MiraBaseShapes with frame-relative integer points and boxes
+    """
+    head_x = layout.head_x
+    head_y = layout.head_y + bob_offset/2
+    body_x = layout.body_x
+    body_y = layout.body_y
+    body_width = layout.body_width
+    robe_top_width = layout.robe_top_width
+    robe_bottom_width = layout.robe_bottom_width
+    robe_bottom_y = body_y + layout.body_height + bob_offset
+    
+    # Robe/body (trapezoid shape)
+    robe = [
+        (body_x + (body_width - robe_top_width)/2, body_y),
+        (body_x + (body_width + robe_top_width)/2, body_y),
+        (body_x + (body_width + robe_bottom_width)/2, robe_bottom_y),
+        (body_x + (body_width - robe_bottom_width)/2, robe_bottom_y)
+    ]
+    
+    # Head with silver hair in bun
+    head = (head_x, head_y, head_x + layout.head_width, head_y + layout.head_height)
+    
+    # Face (slightly smaller ellipse)
+    face_x = layout.face_x
+    face_y = layout.face_y + bob_offset/2
+    face = (face_x, face_y, face_x + layout.face_width, face_y + layout.face_height)
+    
+    # Glasses frames and the bridge between them
+    glasses_size = layout.glasses_size
+    left_eye_x = layout.left_eye_x
+    right_eye_x = layout.right_eye_x
+    eyes_y = layout.eyes_y + bob_offset/2
+    left_glass = (left_eye_x, eyes_y, left_eye_x + glasses_size, eyes_y + glasses_size)
+    right_glass = (right_eye_x, eyes_y, right_eye_x + glasses_size, eyes_y + glasses_size)
+    bridge = (left_eye_x + glasses_size, eyes_y + glasses_size/2, right_eye_x, eyes_y + glasses_size/2)
+    
+    # Hair bun on top of head
+    bun_size = layout.bun_size
+    bun_x = layout.bun_x
+    bun_y = layout.bun_y + bob_offset/2
+    bun = (bun_x, bun_y, bun_x + bun_size, bun_y + bun_size)
+    
+    return MiraBaseShapes(
+        [(int(x), int(y)) for x, y in robe],
+        *(tuple(int(v) for v in box) for box in (head, face, left_glass, right_glass, bridge, bun))
+    )
+
+@lru_cache(maxsize=None)
+def render_mira_base(layout, primary_color, secondary_color, accent_color):
+    """
+    Render Mira's static body (robe, head, face, glasses and hair bun) once.
+    
+    Talking and pointing frames all share this exact body, so it is cached and
+    pasted into each frame; only the animated parts are drawn per frame.
+    """
+    base = Image.new('RGBA', (layout.width, layout.height), (0, 0, 0, 0))
+    draw_mira_base(ImageDraw.Draw(base), layout, primary_color, secondary_color, accent_color)
+    return base
+
+def draw_mira_base(draw, layout, primary_color, secondary_color, accent_color, x_offset=0, bob_offset=0):
+    """
+    Draw the parts of Mira that every pose shares: robe, head, face, glasses and hair bun
+    
+    Args:
+        draw: ImageDraw object
+        layout: Frame proportions from mira_layout()
+        primary_color: Blue robe color
+        secondary_color: Silver hair color
+        accent_color: Gold accessory color
+        x_offset: Horizontal position of the frame within the sprite sheet
+        bob_offset: Vertical bobbing of the robe hem (the head moves half as much)
+    """
+    shapes = mira_base_shapes(layout, bob_offset)
+    
+    def shifted(box):
+        x0, y0, x1, y1 = box
+        return (x0 + x_offset, y0, x1 + x_offset, y1)
+    
+    draw.polygon([(x + x_offset, y) for x, y in shapes.robe], fill=primary_color)
+    draw.ellipse(shifted(shapes.head), fill=secondary_color)
+    draw.ellipse(shifted(shapes.face), fill=(255, 220, 200, 255))  # Light skin tone
+    draw.ellipse(shifted(shapes.left_glass), outline=accent_color, width=1)
+    draw.ellipse(shifted(shapes.right_glass), outline=accent_color, width=1)
+    draw.line(shifted(shapes.bridge), fill=accent_color, width=1)
+    draw.ellipse(shifted(shapes.bun), fill=secondary_color)
+
+def draw_mira_frame(image, draw, layout, primary_color, secondary_color, accent_color, pose, animation_progress, frame_num, waves, x_offset=0):
+    """
+    Draw the animated parts of a single frame of Mira's animation
+    
+    Talking and pointing frames are drawn on top of the cached body from
+    render_mira_base(); the idle pose bobs the whole body, so it is drawn here.
+    Each pose then only adds its own overlay and the floating quill.
+    
+    Args:
+        image: Sprite sheet that draw paints on; the quill glow is composited into it
+        draw: ImageDraw object
+        layout: Frame proportions from mira_layout()
+        primary_color: Blue robe color
+        secondary_color: Silver hair color
+        accent_color: Gold accessory color
+        pose: Animation type ('idle', 'talking', 'pointing')
+        animation_progress: Progress through animation cycle (0.0 to 1.0)
+        frame_num: Current frame number
+        waves: This frame's (half_wave, wave, fast_wave) entry from animation_waves()
+        x_offset: Horizontal position of the frame within the sprite sheet
+    """
+    half_wave, wave, fast_wave = waves
+    
     if pose == 'idle':
-        # Draw flowing robe (wider at bottom)
-        robe_top_width = body_width
-        robe_bottom_width = body_width * 1.3
-        
-        # Robe with slight bobbing motion
-        bob_offset = math.sin(animation_progress * math.pi * 2) * 0.5
-        
-        # Robe/body (trapezoid shape)
-        draw.polygon([
-            (body_x + (body_width - robe_top_width)/2, body_y),
-            (body_x + (body_width + robe_top_width)/2, body_y),
-            (body_x + (body_width + robe_bottom_width)/2, body_y + body_height + bob_offset),
-            (body_x + (body_width - robe_bottom_width)/2, body_y + body_height + bob_offset)
-        ], fill=primary_color)
-        
-        # Head with silver hair in bun
-        draw.ellipse([head_x, head_y + bob_offset/2, head_x + head_width, head_y + head_height + bob_offset/2], 
-                    fill=secondary_color)
-        
-        # Face (slightly smaller ellipse)
-        face_width = head_width * 0.8
-        face_height = head_height * 0.8
-        face_x = head_x + (head_width - face_width) / 2
-        face_y = head_y + (head_height - face_height) / 2 + bob_offset/2
-        draw.ellipse([face_x, face_y, face_x + face_width, face_y + face_height], 
-                    fill=(255, 220, 200, 255))  # Light skin tone
-        
-        # Round glasses
-        glasses_size = head_width * 0.25
-        left_eye_x = head_x + head_width * 0.25 - glasses_size/2
-        right_eye_x = head_x + head_width * 0.75 - glasses_size/2
-        eyes_y = head_y + head_height * 0.4 - glasses_size/2 + bob_offset/2
-        
-        # Draw glasses frames
-        draw.ellipse([left_eye_x, eyes_y, left_eye_x + glasses_size, eyes_y + glasses_size], 
-                    outline=accent_color, width=1)
-        draw.ellipse([right_eye_x, eyes_y, right_eye_x + glasses_size, eyes_y + glasses_size], 
-                    outline=accent_color, width=1)
-        draw.line([left_eye_x + glasses_size, eyes_y + glasses_size/2, 
-                  right_eye_x, eyes_y + glasses_size/2], fill=accent_color, width=1)
-        
-        # Hair bun on top of head
-        bun_size = head_width * 0.35
-        bun_x = head_x + (head_width - bun_size) / 2
-        bun_y = head_y - bun_size * 0.7 + bob_offset/2
-        draw.ellipse([bun_x, bun_y, bun_x + bun_size, bun_y + bun_size], 
-                    fill=secondary_color)
-        
-        # Floating quill (Mira's distinctive feature)
-        quill_bob_offset = bob_offset * 1.5 - 0.5  # More pronounced bobbing for quill
-        draw_floating_quill(draw, width, height, accent_color, quill_bob_offset, animation_progress)
-        
+        # Robe with slight bobbing motion - the whole body bobs, so it can't come from the cached base
+        bob_offset = wave * 0.5
+        draw_mira_base(draw, layout, primary_color, secondary_color, accent_color,
+                      x_offset, bob_offset)
+        
+        # Floating quill (Mira's distinctive feature) bobs more than the body
+        quill_offset = bob_offset * 1.5 - 0.5
+        quill_wave = wave
     elif pose == 'talking':
-        # Similar to idle, but with mouth animation and hand gesture
-        # Robe/body (trapezoid shape)
-        robe_top_width = body_width
-        robe_bottom_width = body_width * 1.3
-        draw.polygon([
-            (body_x + (body_width - robe_top_width)/2, body_y),
-            (body_x + (body_width + robe_top_width)/2, body_y),
-            (body_x + (body_width + robe_bottom_width)/2, body_y + body_height),
-            (body_x + (body_width - robe_bottom_width)/2, body_y + body_height)
-        ], fill=primary_color)
-        
-        # Head with silver hair in bun
-        draw.ellipse([head_x, head_y, head_x + head_width, head_y + head_height], 
-                    fill=secondary_color)
-        
-        # Face (slightly smaller ellipse)
-        face_width = head_width * 0.8
-        face_height = head_height * 0.8
-        face_x = head_x + (head_width - face_width) / 2
-        face_y = head_y + (head_height - face_height) / 2
-        draw.ellipse([face_x, face_y, face_x + face_width, face_y + face_height], 
-                    fill=(255, 220, 200, 255))  # Light skin tone
-        
-        # Round glasses
-        glasses_size = head_width * 0.25
-        left_eye_x = head_x + head_width * 0.25 - glasses_size/2
-        right_eye_x = head_x + head_width * 0.75 - glasses_size/2
-        eyes_y = head_y + head_height * 0.4 - glasses_size/2
-        
-        # Draw glasses frames
-        draw.ellipse([left_eye_x, eyes_y, left_eye_x + glasses_size, eyes_y + glasses_size], 
-                    outline=accent_color, width=1)
-        draw.ellipse([right_eye_x, eyes_y, right_eye_x + glasses_size, eyes_y + glasses_size], 
-                    outline=accent_color, width=1)
-        draw.line([left_eye_x + glasses_size, eyes_y + glasses_size/2, 
-                  right_eye_x, eyes_y + glasses_size/2], fill=accent_color, width=1)
-        
-        # Hair bun on top of head
-        bun_size = head_width * 0.35
-        bun_x = head_x + (head_width - bun_size) / 2
-        bun_y = head_y - bun_size * 0.7
-        draw.ellipse([bun_x, bun_y, bun_x + bun_size, bun_y + bun_size], 
-                    fill=secondary_color)
-        
-        # Mouth animation - changes size based on frame
-        mouth_width = head_width * 0.3 * (0.7 + 0.3 * math.sin(animation_progress * math.pi * 2))
-        mouth_height = head_height * 0.1 * (0.7 + 0.3 * math.sin(animation_progress * math.pi * 2))
-        mouth_x = head_x + (head_width - mouth_width) / 2
-        mouth_y = head_y + head_height * 0.65
-        draw.ellipse([mouth_x, mouth_y, mouth_x + mouth_width, mouth_y + mouth_height], 
-                    fill=(150, 50, 50, 255))  # Mouth color
-        
-        # Talking hand gesture (right hand raised)
-        hand_x = body_x + body_width * 0.8
-        hand_y = body_y + body_height * 0.3
-        hand_size = width * 0.1
-        gesture_offset = math.sin(animation_progress * math.pi * 2) * 2  # Hand moves slightly
-        draw.ellipse([hand_x + gesture_offset, hand_y, 
-                     hand_x + hand_size + gesture_offset, hand_y + hand_size], 
-                     fill=(255, 220, 200, 255))  # Hand color
-        
-        # Floating quill (moves more actively during talking)
-        quill_anim_offset = math.sin(animation_progress * math.pi * 4) * 1.5
-        draw_floating_quill(draw, width, height, accent_color, quill_anim_offset, animation_progress)
+        draw_talking_overlay(draw, layout, wave, x_offset)
         
+        # Floating quill moves more actively during talking
+        quill_offset = fast_wave * 1.5
+        quill_wave = wave
     elif pose == 'pointing':
-        # Similar to talking, but with pointing gesture
-        # Robe/body (trapezoid shape)
-        robe_top_width = body_width
-        robe_bottom_width = body_width * 1.3
-        draw.polygon([
-            (body_x + (body_width - robe_top_width)/2, body_y),
-            (body_x + (body_width + robe_top_width)/2, body_y),
-            (body_x + (body_width + robe_bottom_width)/2, body_y + body_height),
-            (body_x + (body_width - robe_bottom_width)/2, body_y + body_height)
-        ], fill=primary_color)
-        
-        # Head with silver hair in bun
-        draw.ellipse([head_x, head_y, head_x + head_width, head_y + head_height], 
-                    fill=secondary_color)
+        draw_pointing_overlay(draw, layout, primary_color, animation_progress, x_offset)
         
-        # Face (slightly smaller ellipse)
-        face_width = head_width * 0.8
-        face_height = head_height * 0.8
-        face_x = head_x + (head_width - face_width) / 2
-        face_y = head_y + (head_height - face_height) / 2
-        draw.ellipse([face_x, face_y, face_x + face_width, face_y + face_height], 
-                    fill=(255, 220, 200, 255))  # Light skin tone
-        
-        # Round glasses
-        glasses_size = head_width * 0.25
-        left_eye_x = head_x + head_width * 0.25 - glasses_size/2
-        right_eye_x = head_x + head_width * 0.75 - glasses_size/2
-        eyes_y = head_y + head_height * 0.4 - glasses_size/2
-        
-        # Draw glasses frames
-        draw.ellipse([left_eye_x, eyes_y, left_eye_x + glasses_size, eyes_y + glasses_size], 
-                    outline=accent_color, width=1)
-        draw.ellipse([right_eye_x, eyes_y, right_eye_x + glasses_size, eyes_y + glasses_size], 
-                    outline=accent_color, width=1)
-        draw.line([left_eye_x + glasses_size, eyes_y + glasses_size/2, 
-                  right_eye_x, eyes_y + glasses_size/2], fill=accent_color, width=1)
-        
-        # Hair bun on top of head
-        bun_size = head_width * 0.35
-        bun_x = head_x + (head_width - bun_size) / 2
-        bun_y = head_y - bun_size * 0.7
-        draw.ellipse([bun_x, bun_y, bun_x + bun_size, bun_y + bun_size], 
-                    fill=secondary_color)
-        
-        # Small mouth (fixed, not animated)
-        mouth_width = head_width * 0.25
-        mouth_height = head_height * 0.05
-        mouth_x = head_x + (head_width - mouth_width) / 2
-        mouth_y = head_y + head_height * 0.65
-        draw.ellipse([mouth_x, mouth_y, mouth_x + mouth_width, mouth_y + mouth_height], 
-                    fill=(150, 50, 50, 255))  # Mouth color
-        
-        # Pointing gesture (arm extended forward)
-        arm_width = width * 0.1
-        arm_length = width * 0.4
-        arm_x = body_x + body_width * 0.75
-        arm_y = body_y + body_height * 0.3
-        
-        # Animate the pointing gesture
-        gesture_extension = animation_progress * 0.2  # Extending arm animation
-        point_angle = -30 + animation_progress * 10  # Slight angle change
-        point_angle_rad = point_angle * (math.pi / 180)
-        
-        # Calculate arm end point based on angle
-        arm_end_x = arm_x + math.cos(point_angle_rad) * (arm_length * (0.8 + gesture_extension))
-        arm_end_y = arm_y + math.sin(point_angle_rad) * (arm_length * (0.8 + gesture_extension))
-        
-        # Draw arm
-        draw.line([(arm_x, arm_y), (arm_end_x, arm_end_y)], 
-                 fill=primary_color, width=int(arm_width))
-        
-        # Draw hand at the end of the arm
-        hand_size = width * 0.12
-        draw.ellipse([arm_end_x - hand_size/2, arm_end_y - hand_size/2, 
-                     arm_end_x + hand_size/2, arm_end_y + hand_size/2], 
-                     fill=(255, 220, 200, 255))
-        
-        # Draw pointed finger
-        finger_length = hand_size * 0.8
-        finger_angle_rad = point_angle_rad - math.pi/8  # Angle finger slightly up
-        finger_end_x = arm_end_x + math.cos(finger_angle_rad) * finger_length
-        finger_end_y = arm_end_y + math.sin(finger_angle_rad) * finger_length
-        draw.line([(arm_end_x, arm_end_y), (finger_end_x, finger_end_y)], 
-                 fill=(255, 220, 200, 255), width=2)
-        
-        # Floating quill (moves less during pointing as focus is on the gesture)
-        quill_static_offset = 0.5 + animation_progress * 0.5
-        draw_floating_quill(draw, width, height, accent_color, quill_static_offset, animation_progress * 0.5)
+        # Floating quill moves less during pointing as focus is on the gesture
+        quill_offset = 0.5 + animation_progress * 0.5
+        quill_wave = half_wave
+    
+    draw_floating_quill(image, draw, layout, accent_color, quill_offset, quill_wave, x_offset)
+
+def draw_talking_overlay(draw, layout, wave, x_offset=0):
+    """Draw the animated mouth and raised, gesturing hand of the talking pose"""
+    head_width = layout.head_width
+    head_height = layout.head_height
+    head_x = x_offset + layout.head_x
+    head_y = layout.head_y
+    
+    # Mouth animation - changes size based on frame
+    mouth_width = head_width * 0.3 * (0.7 + 0.3 * wave)
+    mouth_height = head_height * 0.1 * (0.7 + 0.3 * wave)
+    mouth_x = head_x + (head_width - mouth_width) / 2
+    mouth_y = head_y + head_height * 0.65
+    draw.ellipse([mouth_x, mouth_y, mouth_x + mouth_width, mouth_y + mouth_height], 
+                fill=(150, 50, 50, 255))  # Mouth color
+    
+    # Talking hand gesture (right hand raised)
+    hand_x = x_offset + layout.body_x + layout.body_width * 0.8
+    hand_y = layout.body_y + layout.body_height * 0.3
+    hand_size = layout.width * 0.1
+    gesture_offset = wave * 2  # Hand moves slightly
+    draw.ellipse([hand_x + gesture_offset, hand_y, 
+                 hand_x + hand_size + gesture_offset, hand_y + hand_size], 
+                 fill=(255, 220, 200, 255))  # Hand color
+
+def draw_pointing_overlay(draw, layout, primary_color, animation_progress, x_offset=0):
+    """Draw the small fixed mouth and the extending, pointing arm of the pointing pose"""
+    width = layout.width
+    head_width = layout.head_width
+    head_height = layout.head_height
+    head_x = x_offset + layout.head_x
+    head_y = layout.head_y
+    
+    # Small mouth (fixed, not animated)
+    mouth_width = head_width * 0.25
+    mouth_height = head_height * 0.05
+    mouth_x = head_x + (head_width - mouth_width) / 2
+    mouth_y = head_y + head_height * 0.65
+    draw.ellipse([mouth_x, mouth_y, mouth_x + mouth_width, mouth_y + mouth_height], 
+                fill=(150, 50, 50, 255))  # Mouth color
+    
+    # Pointing gesture (arm extended forward)
+    arm_width = width * 0.1
+    arm_length = width * 0.4
+    arm_x = x_offset + layout.body_x + layout.body_width * 0.75
+    arm_y = layout.body_y + layout.body_height * 0.3
+    
+    # Animate the pointing gesture
+    gesture_extension = animation_progress * 0.2  # Extending arm animation
+    point_angle = -30 + animation_progress * 10  # Slight angle change
+    point_angle_rad = point_angle * (math.pi / 180)
+    
+    # Calculate arm end point based on angle
+    arm_end_x = arm_x + math.cos(point_angle_rad) * (arm_length * (0.8 + gesture_extension))
+    arm_end_y = arm_y + math.sin(point_angle_rad) * (arm_length * (0.8 + gesture_extension))
+    
+    # Draw arm
+    draw.line([(arm_x, arm_y), (arm_end_x, arm_end_y)], 
+             fill=primary_color, width=int(arm_width))
+    
+    # Draw hand at the end of the arm
+    hand_size = width * 0.12
+    draw.ellipse([arm_end_x - hand_size/2, arm_end_y - hand_size/2, 
+                 arm_end_x + hand_size/2, arm_end_y + hand_size/2], 
+                 fill=(255, 220, 200, 255))
+    
+    # Draw pointed finger
+    finger_length = hand_size * 0.8
+    finger_angle_rad = point_angle_rad - math.pi/8  # Angle finger slightly up
+    finger_end_x = arm_end_x + math.cos(finger_angle_rad) * finger_length
+    finger_end_y = arm_end_y + math.sin(finger_angle_rad) * finger_length
+    draw.line([(arm_end_x, arm_end_y), (finger_end_x, finger_end_y)], 
+             fill=(255, 220, 200, 255), width=2)
 
-def draw_floating_quill(draw, width, height, accent_color, offset_y, animation_progress):
-    """Draw Mira's floating quill with subtle animation"""
+def draw_floating_quill(image, draw, layout, accent_color, offset_y, wave, x_offset=0):
+    """
+    Draw Mira's floating quill with subtle animation, swaying with the given sine wave value
+    
+    image is the sheet draw paints on; the blurred glow is composited into it directly.
+    """
     # Quill positioning
-    quill_x = width * 0.7
-    quill_y = height * 0.3 + offset_y
-    quill_length = width * 0.25
-    quill_width = height * 0.06
-    quill_angle = -30 + (math.sin(animation_progress * math.pi * 2) * 5)
+    quill_x = x_offset + layout.quill_x
+    quill_y = layout.quill_y + offset_y
+    quill_length = layout.quill_length
+    quill_width = layout.quill_width
+    quill_angle = -30 + (wave * 5)
     quill_angle_rad = quill_angle * (math.pi / 180)
     
     # Calculate quill end points
     quill_end_x = quill_x + math.cos(quill_angle_rad) * quill_length
     quill_end_y = quill_y + math.sin(quill_angle_rad) * quill_length
     
+    # Draw a soft glow under the quill: one wide, solid accent line on the shared
+    # frame-sized layer, blurred and composited into this frame's slot
+    glow, glow_draw = _glow_canvas((layout.width, layout.height))
+    glow.paste((0, 0, 0, 0), (0, 0, layout.width, layout.height))
+    glow_draw.line([(quill_x - x_offset, quill_y), (quill_end_x - x_offset, quill_end_y)], 
+                   fill=tuple(accent_color[:3]) + (255,), width=int(quill_width) + 2)
+    image.alpha_composite(glow.filter(ImageFilter.GaussianBlur(1.8)), (x_offset, 0))
+    
     # Draw quill body
     draw.line([(quill_x, quill_y), (quill_end_x, quill_end_y)], 
              fill=accent_color, width=int(quill_width))
@@ -346,14 +500,12 @@ def draw_floating_quill(draw, width, height, accent_color, offset_y, animation_p
     tip_end_y = quill_end_y + math.sin(tip_angle_rad) * tip_length
     draw.line([(quill_end_x, quill_end_y), (tip_end_x, tip_end_y)], 
              fill=accent_color, width=int(quill_width * 0.8))
-    
-    # Draw subtle glow around quill
-    for i in range(2):
-        glow_size = 2 - i*0.5
-        glow_alpha = 70 - i*30
-        glow_color = tuple(list(accent_color) + [glow_alpha])
-        draw.line([(quill_x, quill_y), (quill_end_x, quill_end_y)], 
-                 fill=glow_color, width=int(quill_width + glow_size))
+
+@lru_cache(maxsize=2)
+def _glow_canvas(size):
+    """Allocate the shared quill glow layer for one frame size; only draw_floating_quill() should use it"""
+    layer = Image.new('RGBA', size, (0, 0, 0, 0))
+    return layer, ImageDraw.Draw(layer)
 
 if __name__ == "__main__":
     create_mira_sprites()
@@ -4,12 +4,16 @@ Script to create placeholder player sprites for the Adventure Jumper game.
 """
 
 from PIL import Image, ImageDraw
-import os
+from functools import lru_cache
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
 
 def create_player_sprites():
+    """Create the placeholder player sprites and return the paths written."""
     # Create the player assets directory if it doesn't exist
-    assets_dir = r'c:\Users\User\source\repos\Cascade\adventure-jumper\assets\images\characters\player'
-    os.makedirs(assets_dir, exist_ok=True)
+    assets_dir = REPO_ROOT / 'assets' / 'images' / 'characters' / 'player'
+    assets_dir.mkdir(parents=True, exist_ok=True)
 
     # Define sprite configurations (name, color, size)
     sprites_to_create = [
@@ -20,46 +24,69 @@ def create_player_sprites():
         ('player_death.png', (100, 100, 100), 32, 64),     # Gray for death
     ]
 
+    sprite_paths = []
+    canvases = {}  # One reusable RGBA canvas per sprite size
     for sprite_name, color, width, height in sprites_to_create:
-        # Create a new image with RGBA mode for transparency
-        img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
+        # Reuse the canvas for this size, clearing it back to transparent,
+        # instead of allocating a new image for every sprite
+        img = canvases.get((width, height))
+        if img is None:
+            img = canvases[(width, height)] = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+        else:
+            img.paste((0, 0, 0, 0), (0, 0, width, height))
+        fill = color + (255,)
         
-        # Draw a simple character shape (rectangle with head)
-        # Body
-        draw.rectangle([8, 16, 24, 56], fill=color + (255,))
-        # Head
-        draw.ellipse([6, 4, 26, 20], fill=color + (255,))
+        if 'death' in sprite_name:
+            # Make it lying down (wider, shorter)
+            fill_rect(img, (4, 48, 28, 60), fill)  # Body lying down
+            img.paste(fill, (0, 0), ellipse_mask((width, height), (2, 44, 14, 52)))  # Head
+        else:
+            # Draw a simple character shape (rectangle with head)
+            # Body
+            fill_rect(img, (8, 16, 24, 56), fill)
+            # Head
+            img.paste(fill, (0, 0), ellipse_mask((width, height), (6, 4, 26, 20)))
         
         # Add simple details based on sprite type
         if 'attack' in sprite_name:
             # Add an 'arm' extending forward
-            draw.rectangle([24, 20, 30, 24], fill=color + (255,))
+            fill_rect(img, (24, 20, 30, 24), fill)
         elif 'fall' in sprite_name:
             # Add motion lines
+            draw = ImageDraw.Draw(img)
             draw.line([2, 10, 6, 14], fill=(255, 255, 255, 128), width=2)
             draw.line([2, 20, 6, 24], fill=(255, 255, 255, 128), width=2)
         elif 'landing' in sprite_name:
             # Add impact lines at bottom
+            draw = ImageDraw.Draw(img)
             draw.line([4, 58, 12, 62], fill=(255, 255, 255, 128), width=2)
             draw.line([20, 58, 28, 62], fill=(255, 255, 255, 128), width=2)
         elif 'damaged' in sprite_name:
             # Add 'X' marks to show damage
+            draw = ImageDraw.Draw(img)
             draw.line([2, 2, 8, 8], fill=(255, 255, 255, 200), width=2)
             draw.line([2, 8, 8, 2], fill=(255, 255, 255, 200), width=2)
-        elif 'death' in sprite_name:
-            # Make it lying down (wider, shorter)
-            img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(img)
-            draw.rectangle([4, 48, 28, 60], fill=color + (255,))  # Body lying down
-            draw.ellipse([2, 44, 14, 52], fill=color + (255,))    # Head
         
         # Save the sprite
-        sprite_path = os.path.join(assets_dir, sprite_name)
-        img.save(sprite_path)
+        sprite_path = assets_dir / sprite_name
+        img.save(sprite_path, format='PNG', compress_level=1, optimize=False)
         print(f'Created {sprite_name} at {sprite_path}')
+        sprite_paths.append(sprite_path)
 
     print('All missing player sprites created successfully!')
+    return sprite_paths
+
+def fill_rect(img, box, color):
+    """Fill an inclusive [x0, y0, x1, y1] rectangle (ImageDraw's convention) with a flat paste"""
+    x0, y0, x1, y1 = box
+    img.paste(color, (x0, y0, x1 + 1, y1 + 1))
+
+@lru_cache(maxsize=None)
+def ellipse_mask(size, box):
+    """Build a filled-ellipse mask once so every sprite sharing it can stamp it with a paste"""
+    mask = Image.new('L', size, 0)
+    ImageDraw.Draw(mask).ellipse(box, fill=255)
+    return mask
 
 if __name__ == '__main__':
     create_player_sprites()
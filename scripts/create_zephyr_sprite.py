@@ -7,20 +7,31 @@ This generates sprite sheets for all required Zephyr animation frames:
 - Float animation (12 frames)
 """
 
-from PIL import Image, ImageDraw, ImageFont
-import os
+from PIL import Image, ImageDraw, PngImagePlugin
+from concurrent.futures import ProcessPoolExecutor
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+import hashlib
 import random
 import math
-import colorsys
-import sys
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+OUTPUT_DIR = REPO_ROOT / 'assets' / 'images' / 'characters' / 'npcs'
+
+# Wisps are drawn this many times larger on a layer of their own and scaled
+# down onto the frame, which anti-aliases their thin, tapering lines
+WISP_SUPERSAMPLE = 4
 
 def create_zephyr_sprites():
     """
     Creates all Zephyr NPC sprites with appropriate styling.
+    
+    Returns:
+        List of paths to the created sprite sheets
     """
     # Create output directory if it doesn't exist
-    output_dir = r'c:\Users\User\source\repos\Cascade\adventure-jumper\assets\images\characters\npcs'
-    os.makedirs(output_dir, exist_ok=True)
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
     # Define color scheme for Zephyr based on character specs
     # Zephyr is the Archive Guardian with aether-infused appearance and flowing ethereal design
@@ -36,12 +47,21 @@ def create_zephyr_sprites():
         ('character_zephyr_float.png', 12, 'float')   # 12 frames, 384x32 total
     ]
     
-    # Create each sprite sheet
-    for filename, frames, pose in sprites_to_create:
-        create_zephyr_sprite_sheet(filename, frames, primary_color, secondary_color, accent_color, pose)
-        print(f"Created {filename}")
+    # Create each sprite sheet - sheets share no state, so build them in parallel
+    jobs = [(filename, frames, primary_color, secondary_color, accent_color, pose)
+            for filename, frames, pose in sprites_to_create]
+    with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+        results = list(executor.map(_create_sheet_job, jobs))
+    for output_path, built in results:
+        status = "Created" if built else "Up to date:"
+        print(f"{status} {output_path.name}")
     
     print("All Zephyr sprites created successfully!")
+    return [output_path for output_path, _ in results]
+
+def _create_sheet_job(job):
+    """Process pool entry point: unpack a job tuple and build that sprite sheet"""
+    return create_zephyr_sprite_sheet(*job)
 
 def create_zephyr_sprite_sheet(filename, frame_count, primary_color, secondary_color, accent_color, pose):
     """
@@ -54,8 +74,18 @@ def create_zephyr_sprite_sheet(filename, frame_count, primary_color, secondary_c
         secondary_color: Hair color (white-blue)
         accent_color: Energy color (aqua)
         pose: Animation type ('idle', 'gesture', 'float')
+    
+    Returns:
+        (output_path, built) - built is False when an up-to-date sheet was kept
     """
-    output_dir = r'c:\Users\User\source\repos\Cascade\adventure-jumper\assets\images\characters\npcs'
+    output_path = OUTPUT_DIR / filename
+    
+    # Skip the work entirely if the existing sheet was built from the same inputs. The
+    # script's own source is part of the key, so any drawing change rebuilds every sheet
+    build_key = hashlib.sha1(repr((filename, frame_count, primary_color, secondary_color,
+                                   accent_color, pose)).encode() + Path(__file__).read_bytes()).hexdigest()
+    if sheet_is_up_to_date(output_path, build_key):
+        return output_path, False
     
     # Each frame is 32x32 pixels
     frame_size = 32
@@ -65,32 +95,122 @@ def create_zephyr_sprite_sheet(filename, frame_count, primary_color, secondary_c
     # Create base transparent sprite sheet
     sprite_sheet = Image.new('RGBA', (sprite_width, sprite_height), (0, 0, 0, 0))
     
+    # Sine terms for every frame, computed once per sheet
+    waves = animation_waves(frame_count, POSE_PARAMS[pose].ripple)
+    
+    # Frames are drawn on one reusable 32x32 canvas rather than straight onto the
+    # sheet: the float pose's wisps reach a pixel or two past the frame edge on
+    # both sides, and drawing each frame on its own canvas clips them there
+    frame_img = Image.new('RGBA', (frame_size, frame_size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(frame_img)
+    
     # Generate each frame
     for frame in range(frame_count):
-        # Create a single frame
-        frame_img = Image.new('RGBA', (frame_size, frame_size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(frame_img)
+        # Clear the previous frame off the canvas
+        frame_img.paste((0, 0, 0, 0), (0, 0, frame_size, frame_size))
         
         # Calculate animation offset based on frame number
         animation_progress = frame / max(frame_count - 1, 1)  # 0.0 to 1.0
         
         # Draw Zephyr based on the pose and animation progress
-        draw_zephyr_frame(draw, frame_size, frame_size, primary_color, secondary_color, 
-                      accent_color, pose, animation_progress, frame)
+        draw_zephyr_frame(frame_img, draw, frame_size, frame_size, primary_color, secondary_color, 
+                      accent_color, pose, animation_progress, frame, waves[frame])
         
         # Add the frame to the sprite sheet
         sprite_sheet.paste(frame_img, (frame * frame_size, 0))
     
-    # Save the sprite sheet
-    output_path = os.path.join(output_dir, filename)
-    sprite_sheet.save(output_path)
-    return output_path
+    # Save the sprite sheet, recording the build key in a PNG text chunk. Pillow writes
+    # that chunk before the pixel data, so save to a temporary file and swap it into
+    # place: an interrupted save must never leave a partial sheet carrying a valid key
+    pnginfo = PngImagePlugin.PngInfo()
+    pnginfo.add_text('build_key', build_key)
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    try:
+        sprite_sheet.save(tmp_path, format='PNG', compress_level=1, optimize=False, pnginfo=pnginfo)
+        tmp_path.replace(output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return output_path, True
+
+def sheet_is_up_to_date(output_path, build_key):
+    """
+    Check whether the sheet at output_path was generated from the inputs hashed into build_key
+    
+    The key lives in the PNG itself rather than a sidecar file so nothing extra
+    ends up in the asset folders Flutter bundles. It is read before the pixel
+    data, so the image is decoded too: a truncated sheet counts as out of date.
+    """
+    if not output_path.exists():
+        return False
+    try:
+        with Image.open(output_path) as existing:
+            existing.load()
+            return existing.info.get('build_key') == build_key
+    except OSError:
+        return False
 
-def draw_zephyr_frame(draw, width, height, primary_color, secondary_color, accent_color, pose, animation_progress, frame_num):
+def animation_waves(frame_count, ripple=None):
+    """
+    Precompute the sine terms Zephyr's animations use for every frame of a sheet
+    
+    Args:
+        frame_count: Number of animation frames
+        ripple: The pose's (segments, cycles, amplitude) from POSE_PARAMS, if its robe has a wavy hem
+    
+    Returns:
+        One (half_wave, wave, hem) tuple per frame, holding sin(pi*t) and
+        sin(2*pi*t) for that frame's animation progress t, and the vertical
+        offset of each point along the robe hem (empty without a ripple)
+    """
+    waves = []
+    for frame in range(frame_count):
+        animation_progress = frame / max(frame_count - 1, 1)
+        hem = ()
+        if ripple is not None:
+            segments, cycles, amplitude = ripple
+            hem = tuple(math.sin((i / segments * cycles + animation_progress) * math.pi * 2) * amplitude
+                        for i in range(segments + 1))
+        waves.append((
+            math.sin(animation_progress * math.pi),
+            math.sin(animation_progress * math.pi * 2),
+            hem,
+        ))
+    return waves
+
+ZephyrBody = namedtuple('ZephyrBody', [
+    'width', 'height',
+    'head_x', 'head_y', 'head_width', 'head_height',
+    'body_x', 'body_y', 'body_width', 'body_height',
+    'float_amount',
+])
+
+# Everything that sets one pose apart, looked up in POSE_PARAMS:
+#   float_boost: extra bob on top of the float every pose has (as a multiple of it)
+#   hem_float: how far the robe hem moves with the bob (as a multiple of it)
+#   robe_top_scale, robe_bottom_scale: robe widths as multiples of the body width
+#   ripple: (segments, wave cycles, amplitude in px) of a wavy hem, or None for a straight one
+#   glow_layers: (jitter width, alpha) of each aether glow drawn over the robe
+#   head_alpha, eye_scale, eye_glows: passed on to _draw_head()
+#   effects: draws the pose's own animated extras on top of the body
+PoseParams = namedtuple('PoseParams', [
+    'float_boost', 'hem_float',
+    'robe_top_scale', 'robe_bottom_scale', 'robe_alpha', 'ripple', 'glow_layers',
+    'head_alpha', 'eye_scale', 'eye_glows',
+    'effects',
+])
+
+def draw_zephyr_frame(image, draw, width, height, primary_color, secondary_color, accent_color, pose, animation_progress, frame_num, waves):
     """
     Draw a single frame of Zephyr's animation
     
+    Every pose is the same robed body drawn from its POSE_PARAMS entry, plus
+    that entry's effects. The wisp jitter comes from a generator seeded with
+    the pose and frame number (and the robe glow from glow_jitter()), so
+    rebuilding a sheet reproduces it exactly.
+    
     Args:
+        image: Frame image that draw paints on
         draw: ImageDraw object
         width, height: Frame dimensions
         primary_color: Light blue robe color
@@ -99,7 +219,12 @@ def draw_zephyr_frame(draw, width, height, primary_color, secondary_color, accen
         pose: Animation type ('idle', 'gesture', 'float')
         animation_progress: Progress through animation cycle (0.0 to 1.0)
         frame_num: Current frame number
+        waves: This frame's (half_wave, wave, hem) entry from animation_waves()
     """
+    params = POSE_PARAMS[pose]
+    half_wave, wave, hem = waves
+    rng = random.Random(f'{pose}:{frame_num}')
+    
     # Base character proportions - Zephyr is drawn in 32x32 pixels with ethereal appearance
     head_width = width * 0.4
     head_height = height * 0.35
@@ -113,334 +238,315 @@ def draw_zephyr_frame(draw, width, height, primary_color, secondary_color, accen
     
     # Calculate floating animation for all poses
     # Zephyr is always slightly floating with ethereal movement
-    float_amount = math.sin(animation_progress * math.pi * 2) * 1.5
+    float_amount = wave * 1.5
     
     # Apply the floating offset to base position
     head_y += float_amount * 0.5
     body_y += float_amount * 0.5
     
-    if pose == 'idle':
-        # Draw ethereal robe (flowing, semi-transparent)
-        robe_top_width = body_width
-        robe_bottom_width = body_width * 1.4  # Wider than Mira's robe, more flowing
-        
-        # Create a slightly transparent version of the primary color
-        robe_color = (*primary_color, 220)  # Add alpha channel
-        
-        # Flowing robe with wave effect
-        wave_offset = math.sin(animation_progress * math.pi * 2) * 0.7
-        
-        # Draw main robe body (flowing form with undulating bottom)
-        points = []
-        robe_segments = 8  # number of points to create the flowing bottom edge
-        
-        for i in range(robe_segments + 1):
-            # Create wavy bottom edge
+    # Some poses float further still
+    extra_float = float_amount * params.float_boost
+    head_y += extra_float * 0.5
+    body_y += extra_float * 0.5
+    
+    body = ZephyrBody(width, height, head_x, head_y, head_width, head_height,
+                      body_x, body_y, body_width, body_height, float_amount)
+    _draw_body(image, draw, body, params, primary_color, secondary_color, accent_color, hem, pose)
+    params.effects(image, draw, body, secondary_color, accent_color, animation_progress, half_wave, rng)
+
+def _draw_body(image, draw, body, params, primary_color, secondary_color, accent_color, hem, pose):
+    """Draw the robe, its aether glow and the head as the pose's PoseParams describe them"""
+    body_x, body_y = body.body_x, body.body_y
+    body_width, body_height = body.body_width, body.body_height
+    hem_float = body.float_amount * params.hem_float
+    
+    # Ethereal robe (flowing, semi-transparent)
+    robe_top_width = body_width * params.robe_top_scale
+    robe_bottom_width = body_width * params.robe_bottom_scale
+    robe_color = (*primary_color, params.robe_alpha)  # Add alpha channel
+    
+    if hem:
+        # Flowing form: from the top left corner along the undulating hem
+        # to the top right corner, and back to the start
+        robe_segments = len(hem) - 1
+        points = [(body_x + (body_width - robe_top_width)/2, body_y)]
+        for i in range(1, robe_segments):
             x_percent = i / robe_segments
             x_pos = body_x + (body_width - robe_bottom_width)/2 + robe_bottom_width * x_percent
-            
-            # Each segment has a different wave offset based on position
-            segment_wave = math.sin((x_percent + animation_progress) * math.pi * 2) * 2
-            
-            if i == 0 or i == robe_segments:
-                # First and last points (top corners)
-                if i == 0:
-                    points.append((body_x + (body_width - robe_top_width)/2, body_y))
-                else:
-                    points.append((body_x + (body_width + robe_top_width)/2, body_y))
-            else:
-                # Bottom edge points with wave effect
-                bottom_y = body_y + body_height + segment_wave + float_amount
-                points.append((x_pos, bottom_y))
-        
-        # Connect back to first point
-        points.append((body_x + (body_width - robe_top_width)/2, body_y))
-        
-        # Draw the robe as a polygon
-        draw.polygon(points, fill=robe_color)
-        
-        # Add subtle glow effect around robe edges (aether energy)
-        for i in range(2):
-            glow_points = []
-            glow_width = 1.5 - i * 0.5
-            glow_alpha = 90 - i * 30
-            
-            for point in points:
-                # Slightly expand points for glow effect
-                gx = point[0] + (random.random() - 0.5) * glow_width
-                gy = point[1] + (random.random() - 0.5) * glow_width
-                glow_points.append((gx, gy))
-            
-            # Draw glow
-            glow_color = (*accent_color, glow_alpha)
-            if len(glow_points) >= 3:  # Need at least 3 points for a polygon
-                draw.polygon(glow_points, fill=glow_color)
-        
-        # Head - ethereal appearance
-        # Draw a slightly transparent head
-        head_color = (*secondary_color, 220)  # Add alpha channel
-        draw.ellipse([head_x, head_y, head_x + head_width, head_y + head_height], 
-                    fill=head_color)
-        
-        # Face - more ethereal, less distinct features
-        # Just hint at eyes with glowing dots
-        eye_size = head_width * 0.15
-        left_eye_x = head_x + head_width * 0.25
-        right_eye_x = head_x + head_width * 0.75
-        eyes_y = head_y + head_height * 0.4
-        
-        # Glowing eyes
-        for eye_x in [left_eye_x, right_eye_x]:
-            # Inner glow (brighter)
-            draw.ellipse([eye_x - eye_size/2, eyes_y - eye_size/2, 
-                        eye_x + eye_size/2, eyes_y + eye_size/2], 
-                        fill=accent_color)
-            
-            # Outer glow (softer)
-            larger_size = eye_size * 1.5
-            glow_color = (*accent_color, 100)  # Semi-transparent
-            draw.ellipse([eye_x - larger_size/2, eyes_y - larger_size/2, 
-                        eye_x + larger_size/2, eyes_y + larger_size/2], 
-                        fill=glow_color)
-        
-        # Ethereal energy wisps around the head (aether energy)
-        draw_energy_wisps(draw, head_x + head_width/2, head_y + head_height/2, 
-                         accent_color, animation_progress, radius=head_width * 0.7)
-    
-    elif pose == 'gesture':
-        # Similar to idle, but with arm/hand gesture
-        # Draw ethereal robe base
-        robe_top_width = body_width
-        robe_bottom_width = body_width * 1.4
-        
-        # Create a slightly transparent version of the primary color
-        robe_color = (*primary_color, 220)  # Add alpha channel
-        
-        # Main robe body
-        draw.polygon([
+            points.append((x_pos, body_y + body_height + hem[i] + hem_float))
+        points.append((body_x + (body_width + robe_top_width)/2, body_y))
+        points.append(points[0])
+    else:
+        # Plain trapezoid
+        points = [
             (body_x + (body_width - robe_top_width)/2, body_y),
             (body_x + (body_width + robe_top_width)/2, body_y),
-            (body_x + (body_width + robe_bottom_width)/2, body_y + body_height + float_amount),
-            (body_x + (body_width - robe_bottom_width)/2, body_y + body_height + float_amount)
-        ], fill=robe_color)
-        
-        # Head - ethereal appearance
-        head_color = (*secondary_color, 220)  # Add alpha channel
-        draw.ellipse([head_x, head_y, head_x + head_width, head_y + head_height], 
-                    fill=head_color)
-        
-        # Glowing eyes
-        eye_size = head_width * 0.15
-        left_eye_x = head_x + head_width * 0.25
-        right_eye_x = head_x + head_width * 0.75
-        eyes_y = head_y + head_height * 0.4
-        
-        # Draw eyes with glow
-        for eye_x in [left_eye_x, right_eye_x]:
-            # Inner glow (brighter)
-            draw.ellipse([eye_x - eye_size/2, eyes_y - eye_size/2, 
-                        eye_x + eye_size/2, eyes_y + eye_size/2], 
-                        fill=accent_color)
-            
-            # Outer glow (softer)
-            larger_size = eye_size * 1.5
-            glow_color = (*accent_color, 100)  # Semi-transparent
-            draw.ellipse([eye_x - larger_size/2, eyes_y - larger_size/2, 
-                        eye_x + larger_size/2, eyes_y + larger_size/2], 
-                        fill=glow_color)
-        
-        # Gesture animation - hand raised with energy swirl
-        # Hand position changes with animation progress
-        gesture_height = math.sin(animation_progress * math.pi) * 8
-        hand_x = body_x + body_width * 0.7
-        hand_y = body_y + body_height * 0.3 - gesture_height  # Moves up and down
-        hand_size = width * 0.12
-        
-        # Draw ethereal hand (glowing)
-        hand_color = (*secondary_color, 180)  # Transparent hand
-        draw.ellipse([hand_x - hand_size/2, hand_y - hand_size/2, 
-                     hand_x + hand_size/2, hand_y + hand_size/2], 
-                     fill=hand_color)
-        
-        # Draw energy swirl around hand
-        energy_radius = hand_size * (0.8 + animation_progress * 0.6)  # Grows with animation
-        draw_energy_swirl(draw, hand_x, hand_y, accent_color, animation_progress, energy_radius)
-        
-        # Subtle wisps connecting hand to body
-        draw_connecting_wisps(draw, 
-                             body_x + body_width * 0.5, body_y + body_height * 0.4,
-                             hand_x, hand_y,
-                             accent_color, animation_progress)
-    
-    elif pose == 'float':
-        # Full floating animation with more pronounced movement and energy effects
-        # More extreme floating effect
-        enhanced_float = float_amount * 2.0
-        head_y += enhanced_float * 0.5  # Additional floating movement
-        body_y += enhanced_float * 0.5
-        
-        # Draw ethereal robe with more dynamic flow
-        robe_top_width = body_width * 0.9  # Slightly narrower top for more flow
-        robe_bottom_width = body_width * 1.6  # Much wider at bottom during float
-        
-        # Create a slightly transparent version of the primary color
-        robe_color = (*primary_color, 200)  # More transparent for floating
-        
-        # Flowing robe with stronger wave effect
-        points = []
-        robe_segments = 10  # More points for more fluid movement
-        
-        for i in range(robe_segments + 1):
-            # Create very wavy bottom edge
-            x_percent = i / robe_segments
-            x_pos = body_x + (body_width - robe_bottom_width)/2 + robe_bottom_width * x_percent
-            
-            # Each segment has a different wave offset based on position and time
-            segment_wave = math.sin((x_percent * 2 + animation_progress) * math.pi * 2) * 3
-            
-            if i == 0 or i == robe_segments:
-                # First and last points (top corners)
-                if i == 0:
-                    points.append((body_x + (body_width - robe_top_width)/2, body_y))
-                else:
-                    points.append((body_x + (body_width + robe_top_width)/2, body_y))
-            else:
-                # Bottom edge points with enhanced wave effect
-                bottom_y = body_y + body_height + segment_wave + enhanced_float
-                points.append((x_pos, bottom_y))
-        
-        # Connect back to first point
-        points.append((body_x + (body_width - robe_top_width)/2, body_y))
-        
-        # Draw the robe as a polygon
-        draw.polygon(points, fill=robe_color)
-        
-        # Enhanced glow effect around robe
-        for i in range(3):  # More glow layers
-            glow_points = []
-            glow_width = 2.0 - i * 0.5
-            glow_alpha = 100 - i * 25
-            
-            for point in points:
-                # Expand points for glow effect
-                gx = point[0] + (random.random() - 0.5) * glow_width
-                gy = point[1] + (random.random() - 0.5) * glow_width
-                glow_points.append((gx, gy))
-            
-            # Draw glow
-            glow_color = (*accent_color, glow_alpha)
-            if len(glow_points) >= 3:
-                draw.polygon(glow_points, fill=glow_color)
-        
-        # Head with stronger glow
-        head_color = (*secondary_color, 200)  # More transparent for floating
-        draw.ellipse([head_x, head_y, head_x + head_width, head_y + head_height], 
-                    fill=head_color)
-        
-        # Brighter eyes during float
-        eye_size = head_width * 0.18  # Larger eyes during float
-        left_eye_x = head_x + head_width * 0.25
-        right_eye_x = head_x + head_width * 0.75
-        eyes_y = head_y + head_height * 0.4
-        
-        # Draw eyes with enhanced glow
-        for eye_x in [left_eye_x, right_eye_x]:
-            # Inner glow (brighter)
-            draw.ellipse([eye_x - eye_size/2, eyes_y - eye_size/2, 
-                        eye_x + eye_size/2, eyes_y + eye_size/2], 
-                        fill=accent_color)
-            
-            # Middle glow
-            mid_size = eye_size * 1.5
-            mid_color = (*accent_color, 150)
-            draw.ellipse([eye_x - mid_size/2, eyes_y - mid_size/2, 
-                        eye_x + mid_size/2, eyes_y + mid_size/2], 
-                        fill=mid_color)
-            
-            # Outer glow (softer)
-            larger_size = eye_size * 2.0
-            glow_color = (*accent_color, 80)
-            draw.ellipse([eye_x - larger_size/2, eyes_y - larger_size/2, 
-                        eye_x + larger_size/2, eyes_y + larger_size/2], 
-                        fill=glow_color)
-        
-        # Multiple energy wisps emanating from the body
-        # Center wisp
-        draw_energy_wisps(draw, width/2, height/2, 
-                         accent_color, animation_progress, radius=width * 0.5)
+            (body_x + (body_width + robe_bottom_width)/2, body_y + body_height + hem_float),
+            (body_x + (body_width - robe_bottom_width)/2, body_y + body_height + hem_float)
+        ]
+    draw.polygon(points, fill=robe_color)
+    
+    # Aether glow: jittered copies of the robe outline, each a little tighter
+    jitter = glow_jitter(pose, len(params.glow_layers), len(points))
+    for (glow_width, glow_alpha), layer_jitter in zip(params.glow_layers, jitter):
+        glow_points = [(x + jitter_x * glow_width, y + jitter_y * glow_width)
+                       for (x, y), (jitter_x, jitter_y) in zip(points, layer_jitter)]
+        draw.polygon(glow_points, fill=(*accent_color, glow_alpha))
+    
+    _draw_head(image, draw, body.head_x, body.head_y, body.head_width, body.head_height,
+               secondary_color, accent_color,
+               alpha=params.head_alpha, eye_scale=params.eye_scale, eye_glows=params.eye_glows)
+
+def _draw_head(image, draw, head_x, head_y, head_width, head_height, secondary_color, accent_color,
+               alpha=220, eye_scale=0.15, eye_glows=((1.5, 100),)):
+    """
+    Draw Zephyr's translucent head and glowing eyes
+    
+    Args:
+        image: Frame image that draw paints on; the eye stamps are composited into it
+        alpha: Opacity of the head
+        eye_scale: Eye diameter as a fraction of the head width
+        eye_glows: (size multiplier, alpha) of each glow ring around the eyes
+    """
+    # Head - ethereal appearance
+    head_color = (*secondary_color, alpha)  # Add alpha channel
+    draw.ellipse([head_x, head_y, head_x + head_width, head_y + head_height], 
+                fill=head_color)
+    
+    # Face - more ethereal, less distinct features
+    # Just hint at eyes with glowing dots
+    eye_size = head_width * eye_scale
+    left_eye_x = head_x + head_width * 0.25
+    right_eye_x = head_x + head_width * 0.75
+    eyes_y = head_y + head_height * 0.4
+    
+    # Glowing eyes, blended over the head
+    stamp = eye_glow_stamp(eye_size, accent_color, eye_glows)
+    stamp_radius = stamp.width / 2
+    for eye_x in [left_eye_x, right_eye_x]:
+        image.alpha_composite(stamp, (round(eye_x - stamp_radius), round(eyes_y - stamp_radius)))
+
+@lru_cache(maxsize=8)
+def eye_glow_stamp(eye_size, accent_color, eye_glows):
+    """
+    Render one glowing eye centred on a small transparent image
+    
+    The glow rings are drawn largest first so each brighter ring, and finally
+    the solid core, sits on top of the softer one around it. Eye size is fixed
+    per pose, so each sheet renders its stamp once.
+    """
+    size = math.ceil(eye_size * max(scale for scale, _ in eye_glows)) + 1
+    center = size / 2
+    stamp = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(stamp)
+    
+    for glow_scale, glow_alpha in sorted(eye_glows, reverse=True) + [(1.0, 255)]:
+        glow_size = eye_size * glow_scale
+        draw.ellipse([center - glow_size/2, center - glow_size/2, 
+                     center + glow_size/2, center + glow_size/2], 
+                     fill=(*accent_color, glow_alpha))
+    return stamp
+
+@lru_cache(maxsize=8)
+def glow_jitter(pose, layer_count, point_count):
+    """
+    Random (x, y) offsets in [-0.5, 0.5) for every point of each robe glow layer
+    
+    Drawn once per pose and shared by all frames of its sheet, so the glow
+    loop scales table entries instead of calling the generator twice per point.
+    
+    Returns:
+        layer_count tuples of point_count (jitter_x, jitter_y) pairs
+    """
+    rng = random.Random(f'{pose}:glow')
+    return tuple(
+        tuple((rng.random() - 0.5, rng.random() - 0.5) for _ in range(point_count))
+        for _ in range(layer_count)
+    )
+
+def _idle_effects(image, draw, body, secondary_color, accent_color, animation_progress, half_wave, rng):
+    """Idle pose: ethereal energy wisps around the head (aether energy)"""
+    wisps, wisp_draw = wisp_layer(image)
+    draw_energy_wisps(wisp_draw, body.head_x + body.head_width/2, body.head_y + body.head_height/2, 
+                     accent_color, animation_progress, radius=body.head_width * 0.7, rng=rng,
+                     scale=WISP_SUPERSAMPLE)
+    image.alpha_composite(wisps.reduce(WISP_SUPERSAMPLE))
+
+def _gesture_effects(image, draw, body, secondary_color, accent_color, animation_progress, half_wave, rng):
+    """Gesture pose: a raised hand wrapped in an energy swirl"""
+    body_x, body_y = body.body_x, body.body_y
+    body_width, body_height = body.body_width, body.body_height
+    
+    # Hand position changes with animation progress
+    gesture_height = half_wave * 8
+    hand_x = body_x + body_width * 0.7
+    hand_y = body_y + body_height * 0.3 - gesture_height  # Moves up and down
+    hand_size = body.width * 0.12
+    
+    # Draw ethereal hand (glowing)
+    hand_color = (*secondary_color, 180)  # Transparent hand
+    draw.ellipse([hand_x - hand_size/2, hand_y - hand_size/2, 
+                 hand_x + hand_size/2, hand_y + hand_size/2], 
+                 fill=hand_color)
+    
+    # Draw energy swirl around hand
+    energy_radius = hand_size * (0.8 + animation_progress * 0.6)  # Grows with animation
+    draw_energy_swirl(draw, hand_x, hand_y, accent_color, animation_progress, energy_radius)
+    
+    # Subtle wisps connecting hand to body
+    draw_connecting_wisps(draw, 
+                         body_x + body_width * 0.5, body_y + body_height * 0.4,
+                         hand_x, hand_y,
+                         accent_color, animation_progress)
+
+def _float_effects(image, draw, body, secondary_color, accent_color, animation_progress, half_wave, rng):
+    """Float pose: energy wisps emanating from all around the body, on one supersampled layer"""
+    width, height = body.width, body.height
+    wisps, wisp_draw = wisp_layer(image)
+    
+    # Center wisp
+    draw_energy_wisps(wisp_draw, width/2, height/2, 
+                     accent_color, animation_progress, radius=width * 0.5, rng=rng,
+                     scale=WISP_SUPERSAMPLE)
+    
+    # Additional wisps
+    wisp_count = 3
+    for i in range(wisp_count):
+        angle = (animation_progress + i/wisp_count) * math.pi * 2
+        offset_x = math.cos(angle) * width * 0.15
+        offset_y = math.sin(angle) * height * 0.15
         
-        # Additional wisps
-        wisp_count = 3
-        for i in range(wisp_count):
-            angle = (animation_progress + i/wisp_count) * math.pi * 2
-            offset_x = math.cos(angle) * width * 0.15
-            offset_y = math.sin(angle) * height * 0.15
-            
-            draw_energy_wisps(draw, width/2 + offset_x, height/2 + offset_y, 
-                             accent_color, animation_progress + i/wisp_count, 
-                             radius=width * 0.3)
+        draw_energy_wisps(wisp_draw, width/2 + offset_x, height/2 + offset_y, 
+                         accent_color, animation_progress + i/wisp_count, 
+                         radius=width * 0.3, rng=rng, scale=WISP_SUPERSAMPLE)
+    
+    image.alpha_composite(wisps.reduce(WISP_SUPERSAMPLE))
+
+def wisp_layer(image):
+    """
+    Clear and return the layer WISP_SUPERSAMPLE times the size of image, with its ImageDraw, to draw wisps on
+    
+    The layer and its Draw are created once per size in each process and
+    reused by every frame, like the frame canvas itself.
+    """
+    size = (image.width * WISP_SUPERSAMPLE, image.height * WISP_SUPERSAMPLE)
+    layer, draw = _wisp_canvas(size)
+    layer.paste((0, 0, 0, 0), (0, 0) + size)
+    return layer, draw
+
+@lru_cache(maxsize=2)
+def _wisp_canvas(size):
+    """Allocate the shared wisp layer for one size; only wisp_layer() should use it"""
+    layer = Image.new('RGBA', size, (0, 0, 0, 0))
+    return layer, ImageDraw.Draw(layer)
 
-def draw_energy_wisps(draw, center_x, center_y, color, animation_progress, radius=10.0):
-    """Draw ethereal energy wisps emanating from a central point"""
+POSE_PARAMS = {
+    # Gently waving robe with a faint glow
+    'idle': PoseParams(
+        float_boost=0.0, hem_float=1.0,
+        robe_top_scale=1.0, robe_bottom_scale=1.4, robe_alpha=220,  # Wider than Mira's robe, more flowing
+        ripple=(8, 1, 2), glow_layers=((1.5, 90), (1.0, 60)),
+        head_alpha=220, eye_scale=0.15, eye_glows=((1.5, 100),),
+        effects=_idle_effects,
+    ),
+    # Same robe held still, straight hem
+    'gesture': PoseParams(
+        float_boost=0.0, hem_float=1.0,
+        robe_top_scale=1.0, robe_bottom_scale=1.4, robe_alpha=220,
+        ripple=None, glow_layers=(),
+        head_alpha=220, eye_scale=0.15, eye_glows=((1.5, 100),),
+        effects=_gesture_effects,
+    ),
+    # Stronger bob, more transparent and much wider rippling robe, brighter eyes
+    'float': PoseParams(
+        float_boost=2.0, hem_float=2.0,
+        robe_top_scale=0.9, robe_bottom_scale=1.6, robe_alpha=200,
+        ripple=(10, 2, 3), glow_layers=((2.0, 100), (1.5, 75), (1.0, 50)),
+        head_alpha=200, eye_scale=0.18, eye_glows=((1.5, 150), (2.0, 80)),
+        effects=_float_effects,
+    ),
+}
+
+def draw_energy_wisps(draw, center_x, center_y, color, animation_progress, radius=10.0, rng=random, scale=1):
+    """
+    Draw ethereal energy wisps emanating from a central point, varying their shape with rng
+    
+    Positions and sizes are in frame pixels; scale enlarges the drawing for a
+    supersampled layer (see wisp_layer()).
+    """
     # Number of wisps
     wisp_count = 5
+    segments = 8
+    strokes = wisp_strokes(segments)
     
     for i in range(wisp_count):
         # Each wisp starts at a different angle
         base_angle = (i / wisp_count) * math.pi * 2 + animation_progress * math.pi
         
         # Length of wisp
-        wisp_length = radius * (0.6 + random.random() * 0.4)
+        wisp_length = radius * (0.6 + rng.random() * 0.4)
         
         # Draw curved wisp
         points = []
-        segments = 8
         
         for j in range(segments + 1):
             # Calculate point along the wisp
             t = j / segments
             # Curve the path
-            angle = base_angle + t * math.pi * 0.5 * (random.random() * 0.4 + 0.8)
+            angle = base_angle + t * math.pi * 0.5 * (rng.random() * 0.4 + 0.8)
             # Distance from center decreases toward the end of the wisp
             dist = wisp_length * (1 - t * t)
             # Calculate point
             x = center_x + math.cos(angle) * dist
             y = center_y + math.sin(angle) * dist
-            points.append((x, y))
+            points.append((x * scale, y * scale))
         
-        # Draw the wisp with decreasing width
-        for j in range(segments):
-            # Width decreases along the wisp
-            width = 3 * (1 - j/segments) 
-            # Alpha decreases along the wisp
-            alpha = int(150 * (1 - j/segments))
-            wisp_color = (*color[:3], alpha)
-            
-            # Draw line segment
-            if j < len(points) - 1:  # Ensure we have a next point
-                draw.line([points[j], points[j+1]], fill=wisp_color, width=int(width))
+        # Draw the wisp with decreasing width, one polyline per run of equal width
+        for start, end, width, alpha in strokes:
+            draw.line(points[start:end + 1], fill=(*color[:3], alpha), width=width * scale, joint='curve')
+
+@lru_cache(maxsize=4)
+def wisp_strokes(segments):
+    """
+    Split a tapering wisp into runs of segments that share a line width
+    
+    Width falls from 3px to 1px and alpha from 150 to 0 along the wisp; each run
+    takes its segments' average alpha, so a wisp is stroked in a few lines
+    instead of one per segment.
+    
+    Returns:
+        Tuple of (start point, end point, width, alpha) per run
+    """
+    strokes = []
+    start = 0
+    while start < segments:
+        width = max(int(3 * (1 - start/segments)), 1)
+        end = start + 1
+        while end < segments and max(int(3 * (1 - end/segments)), 1) == width:
+            end += 1
+        # Alpha falls linearly, so the run's average is the alpha at its midpoint
+        alpha = int(150 * (1 - (start + end - 1) / 2 / segments))
+        strokes.append((start, end, width, alpha))
+        start = end
+    return tuple(strokes)
 
 def draw_energy_swirl(draw, center_x, center_y, color, animation_progress, radius=10.0):
     """Draw a swirling energy pattern around a central point"""
-    # Number of energy particles in the swirl
-    particle_count = 12
+    # Whole swirl turns twice per animation cycle
+    spin = animation_progress * math.pi * 4
     
-    for i in range(particle_count):
+    for base_angle, spread, particle_size, alpha, glow_alpha in swirl_particles(12):
         # Each particle is at a different position in the swirl
-        angle = (i / particle_count) * math.pi * 2 + animation_progress * math.pi * 4
+        angle = base_angle + spin
         
         # Distance from center (spiral effect)
-        distance = radius * (0.4 + 0.6 * (i / particle_count))
+        distance = radius * spread
         
         # Calculate particle position
         x = center_x + math.cos(angle) * distance
         y = center_y + math.sin(angle) * distance
         
-        # Particle size decreases toward the center
-        particle_size = 2 + 2 * (i / particle_count)
-        
         # Particle color with varying alpha
-        alpha = int(200 * (0.5 + 0.5 * i / particle_count))
         particle_color = (*color[:3], alpha)
         
         # Draw the particle
@@ -449,13 +555,37 @@ def draw_energy_swirl(draw, center_x, center_y, color, animation_progress, radiu
                      fill=particle_color)
         
         # Add a glow around larger particles
-        if particle_size > 3:
+        if glow_alpha is not None:
             glow_size = particle_size * 2
-            glow_color = (*color[:3], int(alpha * 0.4))
+            glow_color = (*color[:3], glow_alpha)
             draw.ellipse([x - glow_size/2, y - glow_size/2, 
                           x + glow_size/2, y + glow_size/2], 
                          fill=glow_color)
 
+@lru_cache(maxsize=4)
+def swirl_particles(particle_count):
+    """
+    Precompute the parts of each energy swirl particle that do not change between frames
+    
+    Returns:
+        One (base angle, distance as a fraction of the radius, size, alpha, glow alpha)
+        tuple per particle; glow alpha is None for particles too small to get a glow
+    """
+    particles = []
+    for i in range(particle_count):
+        # Particle size decreases toward the center
+        particle_size = 2 + 2 * (i / particle_count)
+        # Alpha increases away from the center
+        alpha = int(200 * (0.5 + 0.5 * i / particle_count))
+        particles.append((
+            (i / particle_count) * math.pi * 2,
+            0.4 + 0.6 * (i / particle_count),
+            particle_size,
+            alpha,
+            int(alpha * 0.4) if particle_size > 3 else None,
+        ))
+    return tuple(particles)
+
 def draw_connecting_wisps(draw, start_x, start_y, end_x, end_y, color, animation_progress):
     """Draw ethereal wisps connecting two points (like an energy flow)"""
     # Number of wisp lines
@@ -1,160 +1,203 @@
 \
+import argparse
 import re
 import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-
-def parse_markdown(md_content):
-    sprints = []
-    current_sprint = None
-    current_microversion = None
-
-    # Regex to identify Epic or Sprint headers first
-    # Regex for Epic: ## Epic X: Title
-    # Regex for Sprint: ### **Sprint X: Title (Optional Details)**
-    # Regex for Microversion: ##### **vX.X.X.X - Title**
-    # Regex for Task: - [x] **TX.X**: Description - **Effort**: X hours
-
-    for line in md_content.splitlines():
-        epic_match = re.match(r"^## (Epic \d+:.*)$", line)
-        sprint_match = re.match(r"^### \*\*(Sprint \d+:.*?)(?:\(.*?\))?\*\*[:]?$", line) # Made (Weeks...) optional and non-capturing, added optional colon
-        microversion_match = re.match(r"^##### \*\*v(\d+\.\d+\.\d+\.\d+[a-z]?) - (.*?)\*\*.*$", line) # Made title capture non-greedy
-        task_match = re.match(r"^- \[(x| |✅)\] \*\*([A-Z]+\d+(?:\.\d+)*)\*\*: (.*?)(?: - \*\*Effort|\[Effort|\(Effort|Dependencies|Assignee|Granular Steps|Completion Notes|$)", line)
-
-
-        if epic_match:
-            if current_sprint: # An Epic or a previous Sprint was active
-                sprints.append(current_sprint)
-            current_sprint = {"title": epic_match.group(1).strip(), "microversions": []}
-            current_microversion = None # Reset microversion when a new epic starts
-        elif sprint_match:
-            if current_sprint: # An Epic or a previous Sprint was active
-                # If the current_sprint is an Epic, we don't append it yet,
-                # this new sprint is conceptually part of it.
-                # However, for the flat list structure, we close the previous sprint/epic.
-                sprints.append(current_sprint)
-            
-            current_sprint = {"title": sprint_match.group(1).strip(), "microversions": []}
-            current_microversion = None # Reset microversion when a new sprint starts
-        elif microversion_match and current_sprint:
-            if current_microversion: # Save previous microversion if exists
-                current_sprint["microversions"].append(current_microversion)
-            current_microversion = {"title": f"v{microversion_match.group(1)} - {microversion_match.group(2).strip()}", "tasks": []}
-        elif task_match and current_microversion:
-            status_char = task_match.group(1)
-            status = "Complete" if status_char == 'x' or status_char == '✅' else "Open"
-            task_id = task_match.group(2)
-            description = task_match.group(3).strip()
-            # Clean up description further if needed, the regex for task_match tries to stop before metadata
-            current_microversion["tasks"].append({"id": task_id, "description": description, "status": status})
-
-    # Append the last processed microversion and sprint
-    if current_microversion and current_sprint:
-        current_sprint["microversions"].append(current_microversion)
-    if current_sprint:
-        sprints.append(current_sprint)
+from html import escape
+from itertools import chain
+
+# One alternation for every structural line; the outer named group (m.lastgroup) says which kind matched
+_LINE_RE = re.compile(
+    # Epic: ## Epic X: Title
+    r"(?P<epic>## (?P<epic_title>Epic \d+:.*)$)"
+    # Sprint: ### **Sprint X: Title (Optional Details)** - (Weeks...) optional and non-capturing, optional colon
+    r"|(?P<sprint>### \*\*(?P<sprint_title>Sprint \d+:.*?)(?:\(.*?\))?\*\*[:]?$)"
+    # Microversion: ##### **vX.X.X.X - Title** - title capture non-greedy
+    r"|(?P<mv>##### \*\*v(?P<mv_version>\d+\.\d+\.\d+\.\d+[a-z]?) - (?P<mv_title>.*?)\*\*.*$)"
+    # Task: - [x] **TX.X**: Description - **Effort**: X hours
+    r"|(?P<task>- \[(?P<task_status>x| |✅)\] \*\*(?P<task_id>[A-Z]+\d+(?:\.\d+)*)\*\*: (?P<task_desc>.*)$)"
+)
+# Literal prefixes of the four _LINE_RE alternatives, tasks first as the most common
+_LINE_PREFIXES = ('- [', '##### **v', '### **Sprint', '## Epic')
+# Task metadata that ends the description; cut with str.find rather than a lazy regex alternation
+_TASK_META = (" - **Effort", "[Effort", "(Effort", "Dependencies", "Assignee", "Granular Steps", "Completion Notes")
+
+# A parsed task line; a tuple keeps thousands of tasks far smaller than one dict each
+Task = namedtuple('Task', 'id description status')
+
+# Task statuses, interned so every Task shares one object per status
+_COMPLETE = sys.intern("Complete")
+_OPEN = sys.intern("Open")
+# Checkbox marks that count as done, and the CSS class for each task status
+_DONE = frozenset(('x', '✅'))
+_CLASS = {_COMPLETE: sys.intern('task-complete'), _OPEN: sys.intern('task-open')}
+
+# Section and microversion openers; a single %s each, filled with printf-style formatting
+_SECTION = '<section class="sprint">\n  <h2>%s</h2>\n'
+_MV_OPEN = '  <div class="microversion">\n    <h3>%s</h3>\n'
+# Row template shared by every task, formatted rather than rebuilt as an f-string per row
+_TASK_LI = '      <li class="{cls}"><strong>{id}</strong>: {desc}</li>\n'
+# Progress bars for a microversion and for the sprint summary: p = percent, c/t = completed/total tasks
+_PROG = '    <div class="progress-bar-container">\n      <div class="progress-bar" style="width: {p}%;">{c}/{t} ({p:.1f}%)</div>\n    </div>\n'
+_SPRINT_PROG = ('  <div class="sprint-summary progress-bar-container">\n'
+                '      <strong>Sprint Progress:</strong> <div class="progress-bar" style="width: {p}%;">{c}/{t} ({p:.1f}%)</div>\n'
+                '  </div>\n')
+# Sentinel appended to the event stream so the last microversion and sprint get closed
+_END = ('end', None)
+
+def iter_events(lines):
+    # Yields ('sprint', title), ('mv', title) and ('task', Task) in document order, so the
+    # report is rendered in the same pass as the parse instead of building a tree first.
+    # Accepts any iterable of lines, so an open file is parsed lazily without a full read()
+    in_sprint = False
+    in_microversion = False
+    # Text is HTML-escaped once here so the renderer can emit it verbatim
+    esc = escape
+    # Locals for the per-line loop, saving a global lookup on every call
+    match_line = _LINE_RE.match
+    line_prefixes = _LINE_PREFIXES
+    done_marks = _DONE
+    task_meta = _TASK_META
+
+    for line in lines:
+        line = line.rstrip('\n')
+        # Only lines with a structural prefix can match, so everything else skips the regex entirely
+        if not line.startswith(line_prefixes):
+            continue
+        m = match_line(line)
+        if not m:
+            continue
+        kind = m.lastgroup
+
+        if kind == 'epic' or kind == 'sprint':
+            # Epics and Sprints both open a new section in the flat report
+            in_sprint = True
+            in_microversion = False # Reset microversion when a new epic/sprint starts
+            yield ('sprint', esc(m.group(kind + '_title').strip(), quote=False))
+        elif kind == 'mv' and in_sprint:
+            in_microversion = True
+            yield ('mv', esc(f"v{m.group('mv_version')} - {m.group('mv_title').strip()}", quote=False))
+        elif kind == 'task' and in_microversion:
+            status_char = m.group('task_status')
+            status = _COMPLETE if status_char in done_marks else _OPEN
+            task_id = m.group('task_id')
+            description = m.group('task_desc')
+            cut = min([i for i in (description.find(s) for s in task_meta) if i >= 0], default=len(description))
+            description = esc(description[:cut].strip(), quote=False)
+            yield ('task', Task(task_id, description, status))
+
+def _write_microversion(write, title, tasks, completed):
+    write(_MV_OPEN % title)
     
-    return sprints
-
-def generate_html_report(sprints, output_path, css_path):
-    # Corrected f-string for HTML content
-    html_content = f"""<!DOCTYPE html>
+    total = len(tasks)
+    progress = (completed / total * 100) if total > 0 else 0
+    
+    write(_PROG.format(p=progress, c=completed, t=total))
+    
+    if tasks:
+        write("    <ul>\n")
+        for task in tasks:
+            status_class = _CLASS[task.status]
+            write(_TASK_LI.format(cls=status_class, id=task.id, desc=task.description))
+        write("    </ul>\n")
+    else:
+        write("    <p>No tasks defined for this microversion.</p>\n")
+    write("  </div>\n")
+
+def generate_html_report(events, output_path, css_path):
+    css_rel = os.path.relpath(css_path, os.path.dirname(output_path))
+    generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    # Stream fragments straight into a large write buffer instead of growing one string with +=.
+    # The plan is parsed while writing, so write to a temporary file and swap it into place:
+    # an error mid-parse must not leave a truncated report over the previous good one
+    tmp_path = output_path + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            write = f.write
+            # Corrected f-string for HTML content
+            write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Agile Sprint Status Report</title>
-    <link rel="stylesheet" href="{os.path.relpath(css_path, os.path.dirname(output_path))}">
+    <link rel="stylesheet" href="{css_rel}">
 </head>
 <body>
     <header>
         <h1>Adventure Jumper - Agile Sprint Status Report</h1>
-        <p>Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+        <p>Generated on: {generated_at}</p>
     </header>
     <main>
-"""
-
-    for sprint in sprints:
-        if not sprint["microversions"] and not sprint.get("tasks"): # Skip if no microversions and no direct tasks (for Epics that might not have direct microversions)
-            # Check if it's an Epic-like structure that might contain sprints (which are handled as separate items in the flat list)
-            is_epic_title = sprint['title'].lower().startswith("epic")
-            # If it's an epic and has no microversions, it might just be a container title, so skip direct rendering here.
-            # Sprints under it would be separate items in the `sprints` list.
-            if is_epic_title and not sprint["microversions"]:
-                 # We could add a header for the Epic here if we change the structure to be nested.
-                 # For a flat list, Epics without microversions of their own are just titles that precede their sprints.
-                 # To avoid empty sections for Epics that only serve as titles for subsequent Sprints:
-                pass # Continue to the next item, which might be a Sprint under this Epic.
-
-        html_content += f'''<section class="sprint">
-  <h2>{sprint['title']}</h2>
-'''
-        
-        total_sprint_tasks = 0
-        completed_sprint_tasks = 0
-
-        # Handle tasks directly under a sprint/epic if any (though current parsing focuses on microversions)
-        if sprint.get("tasks"): # Should not happen with current parsing logic but good for robustness
-            direct_tasks = sprint.get("tasks", [])
-            total_sprint_tasks += len(direct_tasks)
-            completed_sprint_tasks += sum(1 for task in direct_tasks if task['status'] == 'Complete')
-            if direct_tasks:
-                html_content += "  <ul>\n"
-                for task in direct_tasks:
-                    status_class = 'task-complete' if task['status'] == 'Complete' else 'task-open'
-                    html_content += f'''      <li class="{status_class}"><strong>{task['id']}</strong>: {task['description']}</li>
-'''
-                html_content += "  </ul>\n"
-
-
-        for mv in sprint["microversions"]:
-            html_content += f'''  <div class="microversion">
-    <h3>{mv['title']}</h3>
-'''
-            
-            total_mv_tasks = len(mv['tasks'])
-            completed_mv_tasks = sum(1 for task in mv['tasks'] if task['status'] == 'Complete')
-            
-            # Add microversion tasks to sprint totals
-            total_sprint_tasks += total_mv_tasks
-            completed_sprint_tasks += completed_mv_tasks
+""")
+
+            in_sprint = False
+            mv_title = None
+            # Only the open microversion's tasks are held, since its progress bar precedes its task list
+            for event in chain(events, (_END,)):
+                kind = event[0]
+                if kind == 'task':
+                    task = event[1]
+                    mv_tasks.append(task)
+                    if task.status is _COMPLETE:
+                        mv_completed += 1
+                    continue
+
+                # Any heading, or the end of the plan, closes the open microversion
+                if mv_title is not None:
+                    _write_microversion(write, mv_title, mv_tasks, mv_completed)
+                    total_sprint_tasks += len(mv_tasks)
+                    completed_sprint_tasks += mv_completed
+                    mv_title = None
+
+                if kind == 'mv':
+                    mv_title = event[1]
+                    mv_tasks = []
+                    mv_completed = 0
+                    continue
+
+                # A new sprint, or the end of the plan, closes the open sprint
+                if in_sprint:
+                    sprint_progress = (completed_sprint_tasks / total_sprint_tasks * 100) if total_sprint_tasks > 0 else 0
+                    if total_sprint_tasks > 0: # Only show sprint summary if there are tasks
+                        write(_SPRINT_PROG.format(p=sprint_progress, c=completed_sprint_tasks, t=total_sprint_tasks))
+                    write("</section>\n")
+
+                if kind == 'sprint':
+                    title = event[1]
+                    write(_SECTION % title)
+                    in_sprint = True
+                    total_sprint_tasks = 0
+                    completed_sprint_tasks = 0
             
-            mv_progress = (completed_mv_tasks / total_mv_tasks * 100) if total_mv_tasks > 0 else 0
-            
-            html_content += f'''    <div class="progress-bar-container">
-      <div class="progress-bar" style="width: {mv_progress}%;">{completed_mv_tasks}/{total_mv_tasks} ({mv_progress:.1f}%)</div>
-    </div>
-'''
-            
-            if mv['tasks']:
-                html_content += "    <ul>\n"
-                for task in mv['tasks']:
-                    status_class = 'task-complete' if task['status'] == 'Complete' else 'task-open'
-                    html_content += f'''      <li class="{status_class}"><strong>{task['id']}</strong>: {task['description']}</li>
-'''
-                html_content += "    </ul>\n"
-            else:
-                html_content += "    <p>No tasks defined for this microversion.</p>\n"
-            html_content += "  </div>\n"
-
-        sprint_progress = (completed_sprint_tasks / total_sprint_tasks * 100) if total_sprint_tasks > 0 else 0
-        if total_sprint_tasks > 0: # Only show sprint summary if there are tasks
-            html_content += f'''  <div class="sprint-summary progress-bar-container">
-      <strong>Sprint Progress:</strong> <div class="progress-bar" style="width: {sprint_progress}%;">{completed_sprint_tasks}/{total_sprint_tasks} ({sprint_progress:.1f}%)</div>
-  </div>
-'''
-        html_content += "</section>\n"
-        
-    html_content += """
+            write("""
     </main>
     <footer>
         <p>End of Report</p>
     </footer>
 </body>
-</html>"""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+</html>""")
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
     print(f"Report generated: {output_path}")
 
+def generate_report_file(markdown_path, output_path, css_path):
+    if not os.path.exists(markdown_path):
+        print(f"Error: Markdown file not found at {markdown_path}")
+        return
+    with open(markdown_path, 'r', encoding='utf-8', buffering=1 << 20) as f:
+        generate_html_report(iter_events(f), output_path, css_path)
+
+def _report_job(job):
+    # Process pool entry point: unpack a (markdown, html, css) job tuple
+    return generate_report_file(*job)
+
 if __name__ == "__main__":
     script_dir = os.path.dirname(os.path.abspath(__file__))
     # Assuming the script is in 'adventure-jumper/scripts/'
@@ -166,11 +209,19 @@ if __name__ == "__main__":
     # CSS is in the same directory as the script
     css_file_path = os.path.join(script_dir, "report_style.css") 
 
-    if not os.path.exists(markdown_file_path):
-        print(f"Error: Markdown file not found at {markdown_file_path}")
+    parser = argparse.ArgumentParser(description="Generate HTML status reports from agile sprint plans.")
+    parser.add_argument('--inputs', nargs='+', metavar='MARKDOWN',
+                        help="sprint plan files to report on; each writes <name>_status_report.html next to it")
+    args = parser.parse_args()
+
+    if args.inputs:
+        jobs = [(path, os.path.splitext(path)[0] + "_status_report.html", css_file_path) for path in args.inputs]
+    else:
+        jobs = [(markdown_file_path, output_html_path, css_file_path)]
+
+    if len(jobs) == 1:
+        _report_job(jobs[0])
     else:
-        with open(markdown_file_path, 'r', encoding='utf-8') as f:
-            md_content = f.read()
-        
-        sprints_data = parse_markdown(md_content)
-        generate_html_report(sprints_data, output_html_path, css_file_path)
+        # Plans share no state, so render them in parallel
+        with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+            list(executor.map(_report_job, jobs))
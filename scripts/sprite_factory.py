@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Script to build the Mira NPC sprite sheets and the placeholder player sprites
+for Adventure Jumper in a single run.
+
+Running create_mira_sprite.py and create_sprites.py one after the other pays
+for interpreter start-up and the PIL import twice; one run saves one of each.
+Mira's sheets are still built in a process pool, and on Windows those spawned
+workers import PIL again themselves.
+"""
+
+from create_mira_sprite import create_mira_sprites
+from create_sprites import create_player_sprites
+
+def build_all():
+    """
+    Builds every sprite produced by create_mira_sprite.py and create_sprites.py.
+    
+    Returns:
+        List of paths to all created sprite files
+    """
+    return create_mira_sprites() + create_player_sprites()
+
+if __name__ == "__main__":
+    build_all()